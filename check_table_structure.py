@@ -3,102 +3,242 @@
 Check Table Structure of CHECKOUT_FUNNEL_V5
 """
 
+import io
+import itertools
+import json
 import os
-import snowflake.connector
-from snowflake.connector import connect
+import sys
+import tempfile
+import time
+
+from snowflake_session import snowflake_session
+
+# Snowflake error code for "Object does not exist or not authorized"
+OBJECT_DOES_NOT_EXIST = 2003
+
+COLUMNS_QUERY = (
+    "SELECT column_name, data_type, is_nullable, column_default "
+    "FROM PROD__US.INFORMATION_SCHEMA.COLUMNS "
+    "WHERE table_schema = 'DBT_ANALYTICS' AND table_name = 'CHECKOUT_FUNNEL_V5' "
+    "ORDER BY ordinal_position"
+)
+
+TABLES_COLUMNS_QUERY = (
+    "SELECT table_name, column_name, data_type, is_nullable, column_default "
+    "FROM PROD__US.INFORMATION_SCHEMA.COLUMNS "
+    "WHERE table_schema = 'DBT_ANALYTICS' AND table_name IN ({placeholders}) "
+    "ORDER BY table_name, ordinal_position"
+)
+
+# row_count and last_altered must be fresh, since last_altered decides whether
+# the local schema cache is still valid; selecting CURRENT_TIMESTAMP() makes
+# Snowflake evaluate the query every time instead of reusing a cached result
+TABLE_INFO_QUERY = (
+    "SELECT row_count, last_altered, CURRENT_TIMESTAMP() "
+    "FROM PROD__US.INFORMATION_SCHEMA.TABLES "
+    "WHERE table_schema = 'DBT_ANALYTICS' AND table_name = 'CHECKOUT_FUNNEL_V5'"
+)
+
+# Column metadata is cached locally and reused while last_altered is unchanged
+SCHEMA_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "ga_ai", "checkout_funnel_v5_schema.json"
+)
 
 def check_table_structure():
     """Check the structure of CHECKOUT_FUNNEL_V5 table."""
+    # Collect the report in memory and write it to stdout in one call
+    out = io.StringIO()
+    try:
+        print(f"🔍 Checking structure of CHECKOUT_FUNNEL_V5 table...", file=out)
+        print("-" * 50, file=out)
+
+        # Reuse the process-wide Snowflake session
+        with snowflake_session() as conn:
+            cursor = conn.cursor()
+            try:
+                _check_table_structure(conn, cursor, out)
+            finally:
+                cursor.close()
+
+    except Exception as e:
+        print(f"❌ Error: {e}", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
+
+def check_tables_structure(table_names):
+    """Check the structure of several DBT_ANALYTICS tables with a single query."""
+    # An empty IN () list is a SQL compilation error, so skip the session entirely
+    if not table_names:
+        return {}
+
+    out = io.StringIO()
+    tables = {}
     try:
-        # Get connection parameters from environment
-        account = os.environ.get('SNOWFLAKE_ACCOUNT')
-        user = os.environ.get('SNOWFLAKE_USER')
-        authenticator = os.environ.get('SNOWFLAKE_AUTHENTICATOR', 'externalbrowser')
-        warehouse = os.environ.get('SNOWFLAKE_WAREHOUSE', 'SHARED')
-        
-        print(f"🔍 Checking structure of CHECKOUT_FUNNEL_V5 table...")
-        print("-" * 50)
-        
-        # Connect to Snowflake
-        conn = connect(
-            account=account,
-            user=user,
-            authenticator=authenticator,
-            warehouse=warehouse
-        )
-        
-        cursor = conn.cursor()
-        
-        # Activate warehouse and use database/schema
-        cursor.execute(f"USE WAREHOUSE {warehouse}")
-        cursor.execute("USE DATABASE PROD__US")
-        cursor.execute("USE SCHEMA DBT_ANALYTICS")
-        print("✅ Connected to PROD__US.DBT_ANALYTICS")
-        
-        # Check if the table exists
-        print(f"\n🔍 Checking if CHECKOUT_FUNNEL_V5 exists...")
-        cursor.execute("SHOW TABLES LIKE 'CHECKOUT_FUNNEL_V5' IN PROD__US.DBT_ANALYTICS")
-        table_exists = cursor.fetchall()
-        
-        if table_exists:
-            print("✅ Table CHECKOUT_FUNNEL_V5 found!")
-            
-            # Get table structure
-            print(f"\n📋 Columns in CHECKOUT_FUNNEL_V5:")
-            cursor.execute("DESCRIBE TABLE PROD__US.DBT_ANALYTICS.CHECKOUT_FUNNEL_V5")
-            columns = cursor.fetchall()
-            
+        print(f"🔍 Checking structure of {len(table_names)} tables...", file=out)
+        print("-" * 50, file=out)
+
+        with snowflake_session() as conn:
+            cursor = conn.cursor()
+            try:
+                tables = _fetch_tables_columns(cursor, table_names)
+            finally:
+                cursor.close()
+
+        for table_name in table_names:
+            columns = tables.get(table_name.upper())
             if columns:
-                for i, col in enumerate(columns):
-                    col_name = col[0]
-                    col_type = col[1]
-                    nullable = col[2]
-                    default = col[3]
-                    print(f"  {i+1:2d}. {col_name:<30} {col_type:<20} {nullable:<8} {default}")
+                print(f"\n📋 Columns in {table_name.upper()}:", file=out)
+                _print_columns(columns, out)
             else:
-                print("  No columns found")
-            
-            # Check if we can query the table
-            print(f"\n🔍 Testing a simple query on CHECKOUT_FUNNEL_V5...")
-            try:
-                cursor.execute("SELECT COUNT(*) FROM PROD__US.DBT_ANALYTICS.CHECKOUT_FUNNEL_V5 LIMIT 1")
-                count = cursor.fetchone()
-                print(f"✅ Query successful! Table has data.")
-            except Exception as e:
-                print(f"❌ Query failed: {e}")
-            
-            # Check for specific columns we need
-            print(f"\n🔍 Looking for key columns we need...")
-            needed_columns = [
-                'checkout_created_dt',
-                'merchant_ari', 
-                'user_ari',
-                'total_amount',
-                'is_login_authenticated',
-                'is_identity_approved',
-                'is_fraud_approved',
-                'is_checkout_applied',
-                'is_approved',
-                'is_confirmed',
-                'is_authed',
-                'loan_type'
-            ]
-            
-            column_names = [col[0].lower() for col in columns]
-            for needed_col in needed_columns:
-                if needed_col in column_names:
-                    print(f"  ✅ {needed_col}")
-                else:
-                    print(f"  ❌ {needed_col} - NOT FOUND")
-            
-        else:
-            print("❌ Table CHECKOUT_FUNNEL_V5 not found!")
-        
-        cursor.close()
-        conn.close()
-        
+                print(f"\n❌ Table {table_name.upper()} not found!", file=out)
+
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"❌ Error: {e}", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
+
+    return tables
+
+def _fetch_tables_columns(cursor, table_names):
+    """Fetch column metadata for many tables in one round-trip, keyed by table."""
+    placeholders = ", ".join(["%s"] * len(table_names))
+    cursor.execute(
+        TABLES_COLUMNS_QUERY.format(placeholders=placeholders),
+        [name.upper() for name in table_names]
+    )
+    rows = cursor.fetchall()
+    return {
+        table_name: [row[1:] for row in table_rows]
+        for table_name, table_rows in itertools.groupby(rows, key=lambda row: row[0])
+    }
+
+def _print_columns(columns, out):
+    """Print one line per column: name, type, nullability and default."""
+    for i, col in enumerate(columns):
+        col_name = col[0]
+        col_type = col[1]
+        nullable = col[2]
+        default = col[3]
+        print(f"  {i+1:2d}. {col_name:<30} {col_type:<20} {nullable:<8} {default}", file=out)
+
+def _fetch_async_results(conn, cursor, query_id):
+    """Wait for an asynchronous query to finish and return its rows."""
+    while conn.is_still_running(conn.get_query_status_throw_if_error(query_id)):
+        time.sleep(0.1)
+    cursor.get_results_from_sfqid(query_id)
+    return cursor.fetchall()
+
+def _fetch_metadata(conn, cursor, query_id):
+    """Fetch a metadata query, treating a missing object as an empty result."""
+    # Imported here so that importing this module does not load the connector
+    from snowflake.connector.errors import ProgrammingError
+
+    try:
+        return _fetch_async_results(conn, cursor, query_id)
+    except ProgrammingError as e:
+        if e.errno != OBJECT_DOES_NOT_EXIST:
+            raise
+        return []
+
+def _load_schema_cache():
+    """Load the cached column metadata, or None if there is no usable cache."""
+    try:
+        with open(SCHEMA_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_schema_cache(last_altered, columns):
+    """Atomically write column metadata to the local schema cache."""
+    cache_dir = os.path.dirname(SCHEMA_CACHE_PATH)
+    os.makedirs(cache_dir, exist_ok=True)
+    # A unique temp file in the same directory, so concurrent runs never
+    # write to the same file and os.replace stays atomic
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"last_altered": last_altered, "columns": [list(col) for col in columns]}, f)
+        os.replace(temp_path, SCHEMA_CACHE_PATH)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def _check_table_structure(conn, cursor, out):
+    """Run the CHECKOUT_FUNNEL_V5 structure checks on an open connection."""
+    # Names are fully qualified, so no USE WAREHOUSE/DATABASE/SCHEMA round-trips
+    print("✅ Connected to PROD__US.DBT_ANALYTICS", file=out)
+
+    # Without a local cache the columns are needed anyway, so submit both
+    # metadata queries together; otherwise only fetch last_altered first
+    schema_cache = _load_schema_cache()
+    cursor.execute_async(TABLE_INFO_QUERY)
+    table_info_query_id = cursor.sfqid
+    columns_query_id = None
+    if schema_cache is None:
+        cursor.execute_async(COLUMNS_QUERY)
+        columns_query_id = cursor.sfqid
+
+    # An empty result or a missing-object error means the table does not
+    # exist, so no separate existence probe is needed
+    print(f"\n🔍 Checking if CHECKOUT_FUNNEL_V5 exists...", file=out)
+    table_info = _fetch_metadata(conn, cursor, table_info_query_id)
+    if not table_info:
+        print("❌ Table CHECKOUT_FUNNEL_V5 not found!", file=out)
+        return
+
+    print("✅ Table CHECKOUT_FUNNEL_V5 found!", file=out)
+    row_count, last_altered, _ = table_info[0]
+    last_altered = str(last_altered)
+
+    if schema_cache is not None and schema_cache.get("last_altered") == last_altered:
+        columns = schema_cache["columns"]
+    else:
+        if columns_query_id is None:
+            cursor.execute_async(COLUMNS_QUERY)
+            columns_query_id = cursor.sfqid
+        columns = _fetch_metadata(conn, cursor, columns_query_id)
+        # An empty list means the fetch failed; caching it would hide the table until it changes
+        if columns:
+            _save_schema_cache(last_altered, columns)
+
+    # Get table structure
+    print(f"\n📋 Columns in CHECKOUT_FUNNEL_V5:", file=out)
+    if columns:
+        _print_columns(columns, out)
+    else:
+        print("  No columns found", file=out)
+
+    # Row count comes from precomputed table metadata, not a warehouse scan
+    print(f"\n🔍 Checking row count of CHECKOUT_FUNNEL_V5...", file=out)
+    # ROW_COUNT is NULL for views and external tables
+    if row_count is None:
+        print(f"⚠️  Row count unavailable (last change at {last_altered}).", file=out)
+    else:
+        print(f"✅ Table has {row_count:,} rows (as of last change at {last_altered}).", file=out)
+
+    # Check for specific columns we need
+    print(f"\n🔍 Looking for key columns we need...", file=out)
+    needed_columns = [
+        'checkout_created_dt',
+        'merchant_ari',
+        'user_ari',
+        'total_amount',
+        'is_login_authenticated',
+        'is_identity_approved',
+        'is_fraud_approved',
+        'is_checkout_applied',
+        'is_approved',
+        'is_confirmed',
+        'is_authed',
+        'loan_type'
+    ]
+
+    column_names = {col[0].lower() for col in columns}
+    for needed_col in needed_columns:
+        if needed_col in column_names:
+            print(f"  ✅ {needed_col}", file=out)
+        else:
+            print(f"  ❌ {needed_col} - NOT FOUND", file=out)
 
 if __name__ == "__main__":
     check_table_structure()
@@ -7,9 +7,110 @@ user-defined questions and analysis logic.
 """
 
 from enhanced_questionnaire import EnhancedAnalysisQuestionnaire
-from questionnaire_config import create_custom_question_set, validate_question_format
+from questionnaire_config import create_custom_question_set, find_invalid_questions
+from bisect import bisect_right
+from types import MappingProxyType
 from typing import List, Dict, Any
 
+# Rating questions that contribute to the overall assessment
+SCORE_KEYS = (
+    "job_satisfaction",
+    "work_life_balance",
+    "career_growth",
+    "compensation",
+    "management_support",
+    "team_collaboration",
+    "company_culture"
+)
+
+# Lower bounds (percent of max score) of the Poor, Fair, Good and Excellent bands
+SATISFACTION_THRESHOLDS = (20, 40, 60, 80)
+
+# Interpretation for each satisfaction band, from Very Poor to Excellent
+SATISFACTION_INTERPRETATIONS = (
+    "Very Poor - Critical issues requiring urgent action",
+    "Poor - Significant issues requiring immediate attention",
+    "Fair - Some concerns that need attention",
+    "Good - Satisfactory level with room for improvement",
+    "Excellent - High satisfaction level"
+)
+
+_URGENT_SATISFACTION_RECOMMENDATIONS = ("Immediate intervention required", "Conduct exit interviews", "Develop retention strategies")
+
+# Job satisfaction recommendations for each satisfaction band
+SATISFACTION_RECOMMENDATIONS = (
+    _URGENT_SATISFACTION_RECOMMENDATIONS,
+    _URGENT_SATISFACTION_RECOMMENDATIONS,
+    ("Conduct detailed surveys", "Address major concerns", "Develop improvement plans"),
+    ("Identify improvement areas", "Gather specific feedback", "Implement targeted improvements"),
+    ("Maintain current practices", "Recognize and reward success", "Share best practices")
+)
+
+def _rating_bands(low: tuple, mid: tuple, high: tuple) -> tuple:
+    """Spread 1-5 rating recommendations over the five satisfaction bands.
+
+    On a 1-5 scale, ratings of 4-5 fall in the Excellent band and 3 in the
+    Good band; everything lower gets the low recommendations.
+    """
+    return (low, low, low, mid, high)
+
+# Recommendations for each satisfaction band, per 1-5 rating question
+WORK_LIFE_RECOMMENDATIONS = _rating_bands(
+    ("Immediate workload review", "Implement flexible work arrangements", "Consider additional resources"),
+    ("Review workload distribution", "Implement flexible policies", "Promote time management"),
+    ("Maintain current policies", "Share best practices", "Monitor workload")
+)
+
+CAREER_GROWTH_RECOMMENDATIONS = _rating_bands(
+    ("Develop career framework", "Create growth opportunities", "Regular career discussions"),
+    ("Enhance development programs", "Create growth paths", "Mentorship programs"),
+    ("Maintain development programs", "Expand opportunities", "Succession planning")
+)
+
+COMPENSATION_RECOMMENDATIONS = _rating_bands(
+    ("Comprehensive compensation review", "Market analysis", "Consider adjustments"),
+    ("Review compensation structure", "Market benchmarking", "Performance incentives"),
+    ("Maintain competitive compensation", "Regular market reviews", "Performance-based rewards")
+)
+
+MANAGEMENT_RECOMMENDATIONS = _rating_bands(
+    ("Immediate management review", "Training programs", "Support structures"),
+    ("Management training", "Feedback mechanisms", "Support systems"),
+    ("Maintain management standards", "Share best practices", "Leadership development")
+)
+
+TEAM_RECOMMENDATIONS = _rating_bands(
+    ("Team dynamics review", "Communication training", "Collaboration processes"),
+    ("Enhance communication", "Team building", "Collaboration tools"),
+    ("Maintain team dynamics", "Cross-team collaboration", "Team building activities")
+)
+
+CULTURE_RECOMMENDATIONS = _rating_bands(
+    ("Culture transformation", "Values definition", "Cultural change management"),
+    ("Culture assessment", "Values clarification", "Culture initiatives"),
+    ("Maintain culture", "Reinforce values", "Culture ambassadors")
+)
+
+# Priority level for each employee concern
+CONCERN_PRIORITIES = MappingProxyType({
+    "Compensation": "High",
+    "Career growth": "High",
+    "Work-life balance": "High",
+    "Management": "High",
+    "Company direction": "Medium",
+    "Job security": "Medium"
+})
+
+# Suggested actions for each employee concern
+CONCERN_ACTIONS = MappingProxyType({
+    "Compensation": ("Market benchmarking", "Compensation review", "Performance-based rewards"),
+    "Career growth": ("Career framework", "Development programs", "Growth opportunities"),
+    "Work-life balance": ("Flexible policies", "Workload review", "Wellness programs"),
+    "Management": ("Management training", "Feedback systems", "Support structures"),
+    "Company direction": ("Communication strategy", "Vision clarity", "Employee involvement"),
+    "Job security": ("Business transparency", "Growth plans", "Employee development")
+})
+
 def create_custom_questionnaire():
     """Create a custom questionnaire for employee satisfaction analysis."""
     
@@ -102,12 +203,12 @@ def create_custom_questionnaire():
     
     # Validate questions
     print("Validating custom questions...")
-    for i, question in enumerate(custom_questions):
-        if validate_question_format(question):
-            print(f"✓ Question {i+1} is valid")
-        else:
-            print(f"✗ Question {i+1} has format issues")
-            return None
+    invalid_questions = find_invalid_questions(custom_questions)
+    if invalid_questions:
+        question_numbers = ", ".join(str(i + 1) for i in invalid_questions)
+        print(f"✗ Question(s) {question_numbers} have format issues")
+        return None
+    print(f"✓ All {len(custom_questions)} questions are valid")
     
     # Create custom question set
     custom_set = create_custom_question_set(
@@ -123,6 +224,9 @@ def create_custom_questionnaire_class():
     """Create a custom questionnaire class with specialized analysis."""
     
     class EmployeeSatisfactionQuestionnaire(EnhancedAnalysisQuestionnaire):
+        # No attributes beyond those of the base class
+        __slots__ = ()
+        
         def __init__(self):
             super().__init__()
             # Override with custom questions
@@ -138,68 +242,16 @@ def create_custom_questionnaire_class():
             """Custom analysis for employee satisfaction."""
             print("\nAnalyzing employee satisfaction responses...\n")
             
-            # Job Satisfaction Analysis
-            job_satisfaction = self.responses.get("job_satisfaction")
-            if job_satisfaction:
-                self.analysis_results["job_satisfaction_analysis"] = {
-                    "score": job_satisfaction,
-                    "interpretation": self._interpret_satisfaction_score(job_satisfaction, 10),
-                    "recommendations": self._get_satisfaction_recommendations(job_satisfaction, 10)
-                }
-            
-            # Work-Life Balance Analysis
-            work_life_balance = self.responses.get("work_life_balance")
-            if work_life_balance:
-                self.analysis_results["work_life_balance_analysis"] = {
-                    "score": work_life_balance,
-                    "interpretation": self._interpret_satisfaction_score(work_life_balance, 5),
-                    "recommendations": self._get_work_life_recommendations(work_life_balance)
-                }
-            
-            # Career Growth Analysis
-            career_growth = self.responses.get("career_growth")
-            if career_growth:
-                self.analysis_results["career_growth_analysis"] = {
-                    "score": career_growth,
-                    "interpretation": self._interpret_satisfaction_score(career_growth, 5),
-                    "recommendations": self._get_career_growth_recommendations(career_growth)
-                }
-            
-            # Compensation Analysis
-            compensation = self.responses.get("compensation")
-            if compensation:
-                self.analysis_results["compensation_analysis"] = {
-                    "score": compensation,
-                    "interpretation": self._interpret_satisfaction_score(compensation, 5),
-                    "recommendations": self._get_compensation_recommendations(compensation)
-                }
-            
-            # Management Support Analysis
-            management_support = self.responses.get("management_support")
-            if management_support:
-                self.analysis_results["management_analysis"] = {
-                    "score": management_support,
-                    "interpretation": self._interpret_satisfaction_score(management_support, 5),
-                    "recommendations": self._get_management_recommendations(management_support)
-                }
-            
-            # Team Collaboration Analysis
-            team_collaboration = self.responses.get("team_collaboration")
-            if team_collaboration:
-                self.analysis_results["team_collaboration_analysis"] = {
-                    "score": team_collaboration,
-                    "interpretation": self._interpret_satisfaction_score(team_collaboration, 5),
-                    "recommendations": self._get_team_recommendations(team_collaboration)
-                }
-            
-            # Company Culture Analysis
-            company_culture = self.responses.get("company_culture")
-            if company_culture:
-                self.analysis_results["company_culture_analysis"] = {
-                    "score": company_culture,
-                    "interpretation": self._interpret_satisfaction_score(company_culture, 5),
-                    "recommendations": self._get_culture_recommendations(company_culture)
-                }
+            # Rating-based analyses, classifying each score only once
+            for response_key, result_key, max_score, recommendations in self._RATING_ANALYSES:
+                score = self.responses.get(response_key)
+                if score:
+                    band = self._classify_satisfaction_score(score, max_score)
+                    self.analysis_results[result_key] = {
+                        "score": score,
+                        "interpretation": SATISFACTION_INTERPRETATIONS[band],
+                        "recommendations": list(recommendations[band])
+                    }
             
             # Concerns Analysis
             concerns = self.responses.get("concerns", [])
@@ -222,121 +274,24 @@ def create_custom_questionnaire_class():
             # Generate overall assessment
             self.analysis_results["overall_assessment"] = self._generate_employee_assessment()
         
+        def _classify_satisfaction_score(self, score: int, max_score: int) -> int:
+            """Return the satisfaction band (0 = Very Poor ... 4 = Excellent) of a score."""
+            return bisect_right(SATISFACTION_THRESHOLDS, score * 100 // max_score)
+        
         def _interpret_satisfaction_score(self, score: int, max_score: int) -> str:
             """Interpret satisfaction scores."""
-            percentage = (score / max_score) * 100
-            
-            if percentage >= 80:
-                return "Excellent - High satisfaction level"
-            elif percentage >= 60:
-                return "Good - Satisfactory level with room for improvement"
-            elif percentage >= 40:
-                return "Fair - Some concerns that need attention"
-            elif percentage >= 20:
-                return "Poor - Significant issues requiring immediate attention"
-            else:
-                return "Very Poor - Critical issues requiring urgent action"
-        
-        def _get_satisfaction_recommendations(self, score: int, max_score: int) -> List[str]:
-            """Get recommendations based on satisfaction score."""
-            percentage = (score / max_score) * 100
-            
-            if percentage >= 80:
-                return ["Maintain current practices", "Recognize and reward success", "Share best practices"]
-            elif percentage >= 60:
-                return ["Identify improvement areas", "Gather specific feedback", "Implement targeted improvements"]
-            elif percentage >= 40:
-                return ["Conduct detailed surveys", "Address major concerns", "Develop improvement plans"]
-            else:
-                return ["Immediate intervention required", "Conduct exit interviews", "Develop retention strategies"]
-        
-        def _get_work_life_recommendations(self, score: int) -> List[str]:
-            """Get work-life balance recommendations."""
-            if score >= 4:
-                return ["Maintain current policies", "Share best practices", "Monitor workload"]
-            elif score >= 3:
-                return ["Review workload distribution", "Implement flexible policies", "Promote time management"]
-            else:
-                return ["Immediate workload review", "Implement flexible work arrangements", "Consider additional resources"]
-        
-        def _get_career_growth_recommendations(self, score: int) -> List[str]:
-            """Get career growth recommendations."""
-            if score >= 4:
-                return ["Maintain development programs", "Expand opportunities", "Succession planning"]
-            elif score >= 3:
-                return ["Enhance development programs", "Create growth paths", "Mentorship programs"]
-            else:
-                return ["Develop career framework", "Create growth opportunities", "Regular career discussions"]
-        
-        def _get_compensation_recommendations(self, score: int) -> List[str]:
-            """Get compensation recommendations."""
-            if score >= 4:
-                return ["Maintain competitive compensation", "Regular market reviews", "Performance-based rewards"]
-            elif score >= 3:
-                return ["Review compensation structure", "Market benchmarking", "Performance incentives"]
-            else:
-                return ["Comprehensive compensation review", "Market analysis", "Consider adjustments"]
-        
-        def _get_management_recommendations(self, score: int) -> List[str]:
-            """Get management support recommendations."""
-            if score >= 4:
-                return ["Maintain management standards", "Share best practices", "Leadership development"]
-            elif score >= 3:
-                return ["Management training", "Feedback mechanisms", "Support systems"]
-            else:
-                return ["Immediate management review", "Training programs", "Support structures"]
-        
-        def _get_team_recommendations(self, score: int) -> List[str]:
-            """Get team collaboration recommendations."""
-            if score >= 4:
-                return ["Maintain team dynamics", "Cross-team collaboration", "Team building activities"]
-            elif score >= 3:
-                return ["Enhance communication", "Team building", "Collaboration tools"]
-            else:
-                return ["Team dynamics review", "Communication training", "Collaboration processes"]
-        
-        def _get_culture_recommendations(self, score: int) -> List[str]:
-            """Get company culture recommendations."""
-            if score >= 4:
-                return ["Maintain culture", "Reinforce values", "Culture ambassadors"]
-            elif score >= 3:
-                return ["Culture assessment", "Values clarification", "Culture initiatives"]
-            else:
-                return ["Culture transformation", "Values definition", "Cultural change management"]
+            return SATISFACTION_INTERPRETATIONS[self._classify_satisfaction_score(score, max_score)]
         
         def _prioritize_concerns(self, concerns: List[str]) -> Dict[str, str]:
             """Prioritize employee concerns."""
-            priority_mapping = {
-                "Compensation": "High",
-                "Career growth": "High",
-                "Work-life balance": "High",
-                "Management": "High",
-                "Company direction": "Medium",
-                "Job security": "Medium"
-            }
-            
-            priorities = {}
-            for concern in concerns:
-                priorities[concern] = priority_mapping.get(concern, "Medium")
-            
-            return priorities
+            return {concern: CONCERN_PRIORITIES.get(concern, "Medium") for concern in concerns}
         
         def _suggest_actions_for_concerns(self, concerns: List[str]) -> Dict[str, List[str]]:
             """Suggest actions for addressing concerns."""
-            actions = {
-                "Compensation": ["Market benchmarking", "Compensation review", "Performance-based rewards"],
-                "Career growth": ["Career framework", "Development programs", "Growth opportunities"],
-                "Work-life balance": ["Flexible policies", "Workload review", "Wellness programs"],
-                "Management": ["Management training", "Feedback systems", "Support structures"],
-                "Company direction": ["Communication strategy", "Vision clarity", "Employee involvement"],
-                "Job security": ["Business transparency", "Growth plans", "Employee development"]
+            return {
+                concern: list(CONCERN_ACTIONS.get(concern, ("Develop specific action plan",)))
+                for concern in concerns
             }
-            
-            concern_actions = {}
-            for concern in concerns:
-                concern_actions[concern] = actions.get(concern, ["Develop specific action plan"])
-            
-            return concern_actions
         
         def _categorize_nps_score(self, score: int) -> str:
             """Categorize Net Promoter Score."""
@@ -349,19 +304,9 @@ def create_custom_questionnaire_class():
         
         def _generate_employee_assessment(self) -> Dict[str, Any]:
             """Generate overall employee satisfaction assessment."""
-            # Calculate average scores
-            scores = [
-                self.responses.get("job_satisfaction", 0),
-                self.responses.get("work_life_balance", 0),
-                self.responses.get("career_growth", 0),
-                self.responses.get("compensation", 0),
-                self.responses.get("management_support", 0),
-                self.responses.get("team_collaboration", 0),
-                self.responses.get("company_culture", 0)
-            ]
-            
-            # Filter out 0 scores (not answered)
-            valid_scores = [s for s in scores if s > 0]
+            # Calculate average scores, filtering out 0 scores (not answered)
+            responses = self.responses
+            valid_scores = [s for s in (responses.get(key, 0) for key in SCORE_KEYS) if s > 0]
             if valid_scores:
                 average_score = sum(valid_scores) / len(valid_scores)
             else:
@@ -409,6 +354,17 @@ def create_custom_questionnaire_class():
                 "key_recommendations": recommendations,
                 "response_count": len(self.responses)
             }
+        
+        # (response key, result key, max score, recommendations per satisfaction band)
+        _RATING_ANALYSES = (
+            ("job_satisfaction", "job_satisfaction_analysis", 10, SATISFACTION_RECOMMENDATIONS),
+            ("work_life_balance", "work_life_balance_analysis", 5, WORK_LIFE_RECOMMENDATIONS),
+            ("career_growth", "career_growth_analysis", 5, CAREER_GROWTH_RECOMMENDATIONS),
+            ("compensation", "compensation_analysis", 5, COMPENSATION_RECOMMENDATIONS),
+            ("management_support", "management_analysis", 5, MANAGEMENT_RECOMMENDATIONS),
+            ("team_collaboration", "team_collaboration_analysis", 5, TEAM_RECOMMENDATIONS),
+            ("company_culture", "company_culture_analysis", 5, CULTURE_RECOMMENDATIONS)
+        )
     
     return EmployeeSatisfactionQuestionnaire
 
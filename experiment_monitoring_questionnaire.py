@@ -7,13 +7,277 @@ specific questions about experiment description, merchant ARIs, test timing,
 control periods, and metrics.
 """
 
-from enhanced_questionnaire import EnhancedAnalysisQuestionnaire
+from enhanced_questionnaire import EnhancedAnalysisQuestionnaire, format_heading, write_json
 from questionnaire_config import create_custom_question_set, validate_question_format
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
+from bisect import bisect_right
+from types import MappingProxyType
 import json
 import os
+import re
+import sys
+
+# ARIs may be separated by any mix of commas, semicolons, newlines or spaces
+ARI_SEPARATOR_RE = re.compile(r"[,;\s]+")
+
+# Custom goals may be separated by commas or newlines
+GOAL_SEPARATOR_RE = re.compile(r"[,\n]+")
+
+# Keywords that make success criteria measurable, matched in lower-cased text
+MEASURABLE_TERMS_RE = re.compile("increase|decrease|improve|reduce|achieve|reach|maintain|exceed")
+PERCENTAGE_TERMS_RE = re.compile("%|percent")
+NUMBER_TERMS_RE = re.compile("number|count|amount|value|rate")
+
+# Lower bounds (ARI count) of each monitoring scope after the first
+MONITORING_SCOPE_THRESHOLDS = (1, 2, 6, 16, 31)
+MONITORING_SCOPES = (
+    "No ARIs selected - monitoring not possible",
+    "Single ARI - focused monitoring",
+    "Small scope - manageable monitoring",
+    "Medium scope - moderate complexity",
+    "Large scope - high complexity",
+    "Very large scope - may need monitoring strategy"
+)
+
+# Lower bounds (days) of each control period assessment after the first
+CONTROL_PERIOD_THRESHOLDS = (7, 14, 30, 90, 180)
+CONTROL_PERIOD_IMPLICATIONS = (
+    "Very short control period - may have seasonal bias, consider longer period for statistical significance",
+    "Short control period - adequate for some metrics, consider longer period for stability",
+    "Good control period - balances stability and relevance",
+    "Excellent control period - good statistical stability and seasonal coverage",
+    "Long control period - excellent stability, good seasonal coverage",
+    "Very long control period - excellent stability, comprehensive seasonal coverage"
+)
+
+# Lower bounds (metric count) of each monitoring complexity after the first
+MONITORING_COMPLEXITY_THRESHOLDS = (1, 4, 8, 13)
+MONITORING_COMPLEXITIES = (
+    "No metrics selected - monitoring not possible",
+    "Low complexity - easy to monitor and analyze",
+    "Medium complexity - manageable monitoring",
+    "High complexity - requires organized monitoring approach",
+    "Very high complexity - consider monitoring dashboard or tools"
+)
+
+# Lower bounds (segment count) of the higher segmentation complexities;
+# "Overall" on its own is always low complexity
+SEGMENTATION_COMPLEXITY_THRESHOLDS = (3, 5)
+SEGMENTATION_COMPLEXITIES = (
+    "Medium complexity - manageable segmentation",
+    "High complexity - consider monitoring tools and dashboards",
+    "Very high complexity - requires dedicated monitoring infrastructure"
+)
+
+# What each segmentation option adds, in the order implications are reported
+SEGMENTATION_IMPLICATIONS = MappingProxyType({
+    "Overall": "Overall monitoring provides baseline performance",
+    "NTA vs. Repeat": "Customer type segmentation - useful for understanding new vs. existing customer behavior",
+    "FICO Bands": "Credit quality segmentation - important for risk assessment and approval patterns",
+    "AOV Bands": "Transaction value segmentation - useful for understanding spending behavior",
+    "ITACS Bands": "Income segmentation - important for affordability and loan sizing",
+    "Loan Type (IB vs. 0%)": "Product segmentation - critical for understanding product preference and performance"
+})
+
+# Description and calculation guidance for each metric option
+METRIC_DESCRIPTIONS = MappingProxyType({
+    "Authed GMV": "Gross Merchandise Value from authenticated users - Total transaction value after user authentication",
+    "Checkouts": "Number of completed checkout processes - Count of users who reached checkout completion",
+    "E2E Conversion": "End-to-end conversion rate - Users who complete the full journey from start to finish",
+    "AOV": "Average Order Value - Total revenue divided by number of orders",
+    "Application Rate": "Rate of users who submit applications - Applications submitted / total users",
+    "Authentication Rate": "Rate of successful user authentications - Successful auths / total attempts",
+    "Approval Rate": "Rate of approved applications - Approved applications / total applications",
+    "Take-up Rate": "Rate of users who accept offers - Accepted offers / total offers presented",
+    "Auth Rate": "Overall authentication success rate - Successful authentications / total attempts",
+    "Median FICO": "Median FICO score of users - Middle value of all user FICO scores",
+    "% Prime+ Population": "Percentage of users with Prime+ status - Prime+ users / total users",
+    "Median ITACS": "Median ITACS score of users - Middle value of all user ITACS scores",
+    "Terms distribution": "Distribution of loan terms selected - Breakdown of term lengths chosen",
+    "% Z-term": "Percentage of zero-term or immediate transactions - Zero-term transactions / total transactions"
+})
+
+# Metrics that show progress towards each experiment goal
+GOAL_METRICS = MappingProxyType({
+    "Increase conversion rates": frozenset({"E2E Conversion", "Application Rate", "Approval Rate", "Take-up Rate"}),
+    "Improve user engagement": frozenset({"Checkouts", "Authentication Rate", "Auth Rate"}),
+    "Reduce customer acquisition costs": frozenset({"Application Rate", "Authentication Rate"}),
+    "Increase average order value": frozenset({"AOV", "Authed GMV"}),
+    "Improve customer satisfaction": frozenset({"E2E Conversion", "Take-up Rate"}),
+    "Test new features or designs": frozenset({"Checkouts", "E2E Conversion", "Application Rate"}),
+    "Optimize pricing strategy": frozenset({"AOV", "Authed GMV", "Terms distribution", "% Z-term"}),
+    "Improve checkout process": frozenset({"Checkouts", "E2E Conversion", "Application Rate"}),
+    "Test APR/pricing changes": frozenset({"AOV", "Authed GMV", "Terms distribution", "% Z-term", "Take-up Rate"}),
+    "Improve credit approval rates": frozenset({"Approval Rate", "Median FICO", "% Prime+ Population", "Median ITACS"}),
+    "Increase loan take-up": frozenset({"Take-up Rate", "E2E Conversion", "Application Rate"}),
+    "Optimize risk assessment": frozenset({"Median FICO", "% Prime+ Population", "Median ITACS", "Approval Rate"})
+})
 
+# Goals without an entry above (custom goals) have no aligned metrics
+NO_GOAL_METRICS = frozenset()
+
+# Every individual metric option, in menu order, and the option that selects them all
+ALL_METRICS = tuple(METRIC_DESCRIPTIONS)
+ALL_METRICS_OPTION = "All metrics from above"
+
+# Metric options grouped by category, in the order categories are reported
+METRIC_CATEGORIES = MappingProxyType({
+    "Financial Metrics": ("Authed GMV", "AOV"),
+    "Conversion Metrics": ("Checkouts", "E2E Conversion", "Application Rate", "Authentication Rate", "Approval Rate", "Take-up Rate", "Auth Rate"),
+    "Credit Quality Metrics": ("Median FICO", "% Prime+ Population", "Median ITACS"),
+    "Product Metrics": ("Terms distribution", "% Z-term")
+})
+
+# Category of each metric option; any other metric is reported as uncategorized
+METRIC_CATEGORY = MappingProxyType({
+    metric: category
+    for category, category_metrics in METRIC_CATEGORIES.items()
+    for metric in category_metrics
+})
+UNCATEGORIZED_METRICS = "Other/Uncategorized"
+
+# Complexity points for an ARI or metric count: 1 above 5, 2 above 10
+COUNT_COMPLEXITY_THRESHOLDS = (6, 11)
+
+# Overall monitoring scope by the larger of the ARI and metric counts,
+# banded like COUNT_COMPLEXITY_THRESHOLDS
+ASSESSMENT_SCOPES = ("Small", "Medium", "Large")
+
+# Lower bounds (complexity score) of the Medium and High complexity levels
+COMPLEXITY_LEVEL_THRESHOLDS = (2, 4)
+COMPLEXITY_LEVELS = ("Low", "Medium", "High")
+
+# Base recommendations for each complexity level
+COMPLEXITY_RECOMMENDATIONS = MappingProxyType({
+    "High": (
+        "Consider using monitoring dashboards or tools",
+        "Implement automated reporting systems",
+        "Establish clear monitoring schedules",
+        "Consider breaking into smaller experiments"
+    ),
+    "Medium": (
+        "Use organized monitoring approaches",
+        "Establish regular review cycles",
+        "Consider monitoring templates"
+    ),
+    "Low": (
+        "Standard monitoring approach should be sufficient",
+        "Focus on data quality and consistency",
+        "Establish baseline measurements"
+    )
+})
+
+# (level, readiness, base recommendations) for every possible complexity score:
+# up to 2 points each for ARIs and metrics, plus 1 for the control period
+MAX_COMPLEXITY_SCORE = 5
+EXPERIMENT_ASSESSMENTS = tuple(
+    (level, "Ready" if level != "High" else "Needs Planning", COMPLEXITY_RECOMMENDATIONS[level])
+    for level in (
+        COMPLEXITY_LEVELS[bisect_right(COMPLEXITY_LEVEL_THRESHOLDS, score)]
+        for score in range(MAX_COMPLEXITY_SCORE + 1)
+    )
+)
+
+# Recommendations added when an optional answer was left empty
+MISSING_ANSWER_RECOMMENDATIONS = (
+    ("additional_context", "Provide additional context for better experiment evaluation"),
+)
+
+# Recommendations added for particular ARI types
+ARI_TYPE_RECOMMENDATIONS = MappingProxyType({
+    "Merchant Partner ARIs": "Partner ARIs selected - ensure proper data access and permissions"
+})
+
+# All dates in the questionnaire are entered as YYYY-MM-DD
+DATE_FORMAT = "%Y-%m-%d"
+
+# Question ids of the test and control period dates
+DATE_FIELDS = ("test_start_date", "test_end_date", "control_start_date", "control_end_date")
+DATE_QUESTION_IDS = frozenset(DATE_FIELDS)
+
+# The same few date answers are parsed again by each validation step, and
+# datetime objects are immutable, so parsed dates are shared
+@lru_cache(maxsize=128)
+def _parse_date(date_string: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD date, or return None if it is not one."""
+    # fromisoformat is much faster than strptime, but also accepts other
+    # ISO 8601 forms, so it is only tried on the zero-padded layout; strptime
+    # still decides everything else (e.g. "2024-1-5")
+    if len(date_string) == 10 and date_string[4] == "-" and date_string[7] == "-":
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(date_string, DATE_FORMAT)
+    except ValueError:
+        return None
+
+# Durations of at least the given number of days are shown in that unit,
+# with the remainder in the smaller unit: (days, unit, remainder days, remainder unit)
+DURATION_UNITS = (
+    (7, "week", 1, "day"),
+    (30, "month", 1, "day"),
+    (365, "year", 30, "month")
+)
+DURATION_UNIT_DAYS = tuple(unit[0] for unit in DURATION_UNITS)
+
+def _count_label(count: int, unit: str) -> str:
+    """Format a count with its unit, pluralized when above one ("2 weeks")."""
+    return f"{count} {unit}{'s' if count > 1 else ''}"
+
+def _humanize_days(duration_days: int) -> str:
+    """Describe a number of days in the largest fitting unit ("4 weeks and 1 day")."""
+    if duration_days < 0:
+        return "Invalid date range (end date before start date)"
+    if duration_days == 0:
+        return "Same day"
+    
+    index = bisect_right(DURATION_UNIT_DAYS, duration_days)
+    if index == 0:
+        return _count_label(duration_days, "day")
+    
+    unit_days, unit, remainder_days, remainder_unit = DURATION_UNITS[index - 1]
+    count, remaining_days = divmod(duration_days, unit_days)
+    if remaining_days == 0:
+        return _count_label(count, unit)
+    return f"{_count_label(count, unit)} and {_count_label(remaining_days // remainder_days, remainder_unit)}"
+
+# Both segmentation assessments depend only on which options were chosen (and,
+# for complexity, how many entries there were), so results are shared per choice
+@lru_cache(maxsize=256)
+def _segmentation_complexity(options: frozenset, segment_count: int) -> str:
+    """Assess monitoring complexity for a set of segmentation options."""
+    if segment_count == 1 and "Overall" in options:
+        return "Low complexity - overall monitoring only"
+    return SEGMENTATION_COMPLEXITIES[bisect_right(SEGMENTATION_COMPLEXITY_THRESHOLDS, segment_count)]
+
+@lru_cache(maxsize=256)
+def _segmentation_implications(options: frozenset) -> str:
+    """Describe what a set of segmentation options adds, in menu order."""
+    implications = [
+        implication for option, implication in SEGMENTATION_IMPLICATIONS.items()
+        if option in options
+    ]
+    
+    if len(implications) == 1:
+        return implications[0]
+    else:
+        return "Multiple segmentation approaches: " + "; ".join(implications)
+
+# Fixed lines of the analysis report
+ANALYSIS_HEADER = (
+    "\n" + "=" * 80,
+    "                    EXPERIMENT MONITORING - ANALYSIS RESULTS",
+    "=" * 80,
+)
+SECTION_RULE = "-" * 60
+OVERALL_ASSESSMENT_BANNER = f"\n{'Overall Assessment':-^80}"
+
+# The questions are static, so they are built and validated once per process
+@lru_cache(maxsize=1)
 def create_experiment_monitoring_questions():
     """Create the experiment monitoring questions."""
     
@@ -107,14 +371,16 @@ def create_experiment_monitoring_questions():
         }
     ]
     
-    # Validate questions
-    print("Validating experiment monitoring questions...")
-    for i, question in enumerate(experiment_questions):
-        if validate_question_format(question):
-            print(f"✓ Question {i+1} is valid")
-        else:
-            print(f"✗ Question {i+1} has format issues")
-            return None
+    # The questions are fixed literals, so validating them is a development
+    # check; it is compiled out under python -O
+    if __debug__:
+        print("Validating experiment monitoring questions...")
+        for i, question in enumerate(experiment_questions):
+            if validate_question_format(question):
+                print(f"✓ Question {i+1} is valid")
+            else:
+                print(f"✗ Question {i+1} has format issues")
+                return None
     
     # Create custom question set
     custom_set = create_custom_question_set(
@@ -126,10 +392,16 @@ def create_experiment_monitoring_questions():
     
     return custom_set
 
+# The class body does not depend on any runtime state, so the class is built
+# once per process and reused by every caller
+@lru_cache(maxsize=1)
 def create_experiment_questionnaire_class():
     """Create a custom questionnaire class for experiment monitoring."""
     
     class ExperimentMonitoringQuestionnaire(EnhancedAnalysisQuestionnaire):
+        # No attributes beyond those of the base class
+        __slots__ = ()
+        
         def __init__(self):
             super().__init__()
             # Override with custom questions
@@ -162,70 +434,77 @@ def create_experiment_questionnaire_class():
         def analyze_responses(self):
             """Custom analysis for experiment monitoring."""
             print("\nAnalyzing experiment monitoring responses...\n")
+            responses = self.responses
+            results = self.analysis_results
             
             # Experiment Description Analysis
-            experiment_desc = self.responses.get("experiment_description")
+            experiment_desc = responses.get("experiment_description")
             if experiment_desc:
-                self.analysis_results["experiment_analysis"] = {
+                results["experiment_analysis"] = {
                     "description": experiment_desc,
                     "description_length": len(experiment_desc),
                     "clarity_assessment": self._assess_description_clarity(experiment_desc)
                 }
             
-            # Merchant ARIs Analysis
-            merchant_aris = self.responses.get("merchant_aris", "")
-            ari_type = self.responses.get("ari_type", "")
+            # Merchant ARIs Analysis (the count is also used by the overall assessment)
+            merchant_aris = responses.get("merchant_aris", "")
+            ari_type = responses.get("ari_type", "")
+            ari_count = len(self._compile_all_aris(merchant_aris))
             if merchant_aris and ari_type:
-                all_aris = self._compile_all_aris(merchant_aris)
-                self.analysis_results["merchant_ari_analysis"] = {
+                results["merchant_ari_analysis"] = {
                     "ari_list": merchant_aris,
                     "ari_type": ari_type,
-                    "total_aris": len(all_aris),
-                    "monitoring_scope": self._assess_monitoring_scope(len(all_aris))
+                    "total_aris": ari_count,
+                    "monitoring_scope": self._assess_monitoring_scope(ari_count)
                 }
             
+            # Parse every date answer once for all of the date checks below
+            dates = self._parse_response_dates()
+            test_start = dates["test_start_date"]
+            test_end = dates["test_end_date"]
+            
             # Test Run Date Analysis
-            test_start_date = self.responses.get("test_start_date", "")
-            test_end_date = self.responses.get("test_end_date", "")
+            test_start_date = responses.get("test_start_date", "")
+            test_end_date = responses.get("test_end_date", "")
             if test_start_date and test_end_date:
                 # Validate test period dates
-                test_validation = self._validate_date_range(test_start_date, test_end_date)
+                test_validation = self._validate_date_range(test_start, test_end)
                 
-                self.analysis_results["test_timing_analysis"] = {
+                results["test_timing_analysis"] = {
                     "test_start_date": test_start_date,
                     "test_end_date": test_end_date,
-                    "test_duration": self._calculate_date_duration(test_start_date, test_end_date),
-                    "timing_implications": self._analyze_test_timing(test_start_date, test_end_date),
+                    "test_duration": self._calculate_date_duration(test_start, test_end),
+                    "timing_implications": self._analyze_test_timing(test_start, test_end),
                     "date_validation": test_validation
                 }
             
             # Control Period Analysis
-            control_start_date = self.responses.get("control_start_date", "")
-            control_end_date = self.responses.get("control_end_date", "")
+            control_start_date = responses.get("control_start_date", "")
+            control_end_date = responses.get("control_end_date", "")
             if control_start_date and control_end_date:
+                control_start = dates["control_start_date"]
+                control_end = dates["control_end_date"]
                 # Validate control period timing relative to test period
-                test_start_date = self.responses.get("test_start_date", "")
-                test_end_date = self.responses.get("test_end_date", "")
                 timing_validation = self._validate_experiment_timing(
-                    control_start_date, control_end_date, test_start_date, test_end_date
+                    control_start, control_end, test_start, test_end
                 )
                 
-                self.analysis_results["control_period_analysis"] = {
+                results["control_period_analysis"] = {
                     "control_start_date": control_start_date,
                     "control_end_date": control_end_date,
-                    "control_duration": self._calculate_date_duration(control_start_date, control_end_date),
-                    "statistical_implications": self._analyze_control_period(control_start_date, control_end_date),
+                    "control_duration": self._calculate_date_duration(control_start, control_end),
+                    "statistical_implications": self._analyze_control_period(control_start, control_end),
                     "timing_validation": timing_validation
                 }
             
-            # Metrics Analysis
-            metrics = self.responses.get("metrics_to_monitor", [])
+            # Metrics Analysis (the count is also used by the overall assessment)
+            metrics = responses.get("metrics_to_monitor", [])
+            all_metrics = self._compile_all_metrics(metrics, "")
             if metrics:
-                all_metrics = self._compile_all_metrics(metrics, "")
                 # Check if "All metrics from above" was selected
-                all_selected = "All metrics from above" in metrics
+                all_selected = ALL_METRICS_OPTION in metrics
                 
-                self.analysis_results["metrics_analysis"] = {
+                results["metrics_analysis"] = {
                     "selected_metrics": metrics,
                     "all_metrics_selected": all_selected,
                     "compiled_metrics": all_metrics,
@@ -236,9 +515,9 @@ def create_experiment_questionnaire_class():
                 }
             
             # Monitoring Segmentation Analysis
-            segmentation = self.responses.get("monitoring_segmentation", [])
+            segmentation = responses.get("monitoring_segmentation", [])
             if segmentation:
-                self.analysis_results["segmentation_analysis"] = {
+                results["segmentation_analysis"] = {
                     "selected_segmentation": segmentation,
                     "total_segments": len(segmentation),
                     "segmentation_complexity": self._assess_segmentation_complexity(segmentation),
@@ -246,16 +525,18 @@ def create_experiment_questionnaire_class():
                 }
             
             # Additional Context Analysis
-            additional_context = self.responses.get("additional_context", "")
+            additional_context = responses.get("additional_context", "")
             if additional_context:
-                self.analysis_results["additional_context_analysis"] = {
+                results["additional_context_analysis"] = {
                     "context": additional_context,
                     "context_length": len(additional_context),
                     "context_clarity": self._assess_description_clarity(additional_context)
                 }
             
             # Generate overall assessment
-            self.analysis_results["overall_assessment"] = self._generate_experiment_assessment()
+            results["overall_assessment"] = self._generate_experiment_assessment(
+                ari_count, len(all_metrics), dates
+            )
         
         def _assess_description_clarity(self, description: str) -> str:
             """Assess the clarity of the experiment description."""
@@ -271,268 +552,191 @@ def create_experiment_questionnaire_class():
                 return "Very detailed - may be overly verbose"
         
         def _compile_all_aris(self, ari_text: str) -> List[str]:
-            """Compile all merchant ARIs from text input for analysis."""
+            """Compile the unique merchant ARIs from text input, in the order given."""
             if not ari_text:
                 return []
             
-            # Parse ARIs from text input (assuming comma-separated, newline-separated, or space-separated)
-            # Handle various separators: commas, newlines, semicolons, or spaces
-            ari_list = []
-            
-            # First try comma separation
-            if ',' in ari_text:
-                ari_list = [ari.strip() for ari in ari_text.split(',') if ari.strip()]
-            # Then try newline separation
-            elif '\n' in ari_text:
-                ari_list = [ari.strip() for ari in ari_text.split('\n') if ari.strip()]
-            # Then try semicolon separation
-            elif ';' in ari_text:
-                ari_list = [ari.strip() for ari in ari_text.split(';') if ari.strip()]
-            # Finally, try space separation for single-line inputs
-            else:
-                ari_list = [ari.strip() for ari in ari_text.split() if ari.strip()]
-            
-            # Filter out empty strings and normalize
-            return [ari for ari in ari_list if ari]
+            # Split on every separator in a single pass; the empty strings left
+            # by leading or trailing separators are dropped, and dict.fromkeys
+            # removes repeated ARIs without a quadratic membership scan
+            return list(dict.fromkeys(ari for ari in ARI_SEPARATOR_RE.split(ari_text) if ari))
         
         def _assess_monitoring_scope(self, ari_count: int) -> str:
             """Assess the scope of monitoring based on ARI count."""
-            if ari_count == 0:
-                return "No ARIs selected - monitoring not possible"
-            elif ari_count == 1:
-                return "Single ARI - focused monitoring"
-            elif ari_count <= 5:
-                return "Small scope - manageable monitoring"
-            elif ari_count <= 15:
-                return "Medium scope - moderate complexity"
-            elif ari_count <= 30:
-                return "Large scope - high complexity"
-            else:
-                return "Very large scope - may need monitoring strategy"
+            return MONITORING_SCOPES[bisect_right(MONITORING_SCOPE_THRESHOLDS, ari_count)]
         
-        def _analyze_test_timing(self, test_start_date: str, test_end_date: str) -> str:
+        def _analyze_test_timing(self, test_start: Optional[datetime], test_end: Optional[datetime]) -> str:
             """Analyze the implications of test timing."""
-            try:
-                start_date = datetime.strptime(test_start_date, "%Y-%m-%d")
-                end_date = datetime.strptime(test_end_date, "%Y-%m-%d")
-                today = datetime.now()
-                
-                # Calculate days since test ended
-                days_since_end = (today - end_date).days
-                
-                if days_since_end <= 1:
-                    return "Very recent test - excellent data freshness and relevance"
-                elif days_since_end <= 7:
-                    return "Recent test - good data freshness and relevance"
-                elif days_since_end <= 30:
-                    return "Recent test - reasonable data age, verify availability"
-                elif days_since_end <= 90:
-                    return "Older test - data may need validation, check availability"
-                else:
-                    return "Old test - significant data age, verify availability and relevance"
-                    
-            except ValueError:
+            if test_start is None or test_end is None:
                 return "Date format error - please use YYYY-MM-DD format"
+            
+            # Calculate days since test ended
+            days_since_end = (datetime.now() - test_end).days
+            
+            if days_since_end <= 1:
+                return "Very recent test - excellent data freshness and relevance"
+            elif days_since_end <= 7:
+                return "Recent test - good data freshness and relevance"
+            elif days_since_end <= 30:
+                return "Recent test - reasonable data age, verify availability"
+            elif days_since_end <= 90:
+                return "Older test - data may need validation, check availability"
+            else:
+                return "Old test - significant data age, verify availability and relevance"
         
-        def _analyze_control_period(self, control_start_date: str, control_end_date: str) -> str:
+        def _analyze_control_period(self, control_start: Optional[datetime], control_end: Optional[datetime]) -> str:
             """Analyze the statistical implications of control period."""
-            try:
-                start_date = datetime.strptime(control_start_date, "%Y-%m-%d")
-                end_date = datetime.strptime(control_end_date, "%Y-%m-%d")
-                
-                # Calculate control period duration in days
-                control_duration = (end_date - start_date).days
-                
-                if control_duration < 7:
-                    return "Very short control period - may have seasonal bias, consider longer period for statistical significance"
-                elif control_duration < 14:
-                    return "Short control period - adequate for some metrics, consider longer period for stability"
-                elif control_duration < 30:
-                    return "Good control period - balances stability and relevance"
-                elif control_duration < 90:
-                    return "Excellent control period - good statistical stability and seasonal coverage"
-                elif control_duration < 180:
-                    return "Long control period - excellent stability, good seasonal coverage"
-                else:
-                    return "Very long control period - excellent stability, comprehensive seasonal coverage"
-                    
-            except ValueError:
+            if control_start is None or control_end is None:
                 return "Date format error - please use YYYY-MM-DD format"
+            
+            # Calculate control period duration in days
+            control_duration = (control_end - control_start).days
+            
+            return CONTROL_PERIOD_IMPLICATIONS[bisect_right(CONTROL_PERIOD_THRESHOLDS, control_duration)]
         
-        def _calculate_date_duration(self, start_date: str, end_date: str) -> str:
+        def _calculate_date_duration(self, start: Optional[datetime], end: Optional[datetime]) -> str:
             """Calculate the duration between two dates."""
-            try:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d")
-                duration_days = (end - start).days
-                
-                if duration_days < 0:
-                    return "Invalid date range (end date before start date)"
-                elif duration_days == 0:
-                    return "Same day"
-                elif duration_days == 1:
-                    return "1 day"
-                elif duration_days < 7:
-                    return f"{duration_days} days"
-                elif duration_days < 30:
-                    weeks = duration_days // 7
-                    remaining_days = duration_days % 7
-                    if remaining_days == 0:
-                        return f"{weeks} week{'s' if weeks > 1 else ''}"
-                    else:
-                        return f"{weeks} week{'s' if weeks > 1 else ''} and {remaining_days} day{'s' if remaining_days > 1 else ''}"
-                elif duration_days < 365:
-                    months = duration_days // 30
-                    remaining_days = duration_days % 30
-                    if remaining_days == 0:
-                        return f"{months} month{'s' if months > 1 else ''}"
-                    else:
-                        return f"{months} month{'s' if months > 1 else ''} and {remaining_days} day{'s' if remaining_days > 1 else ''}"
-                else:
-                    years = duration_days // 365
-                    remaining_days = duration_days % 365
-                    if remaining_days == 0:
-                        return f"{years} year{'s' if years > 1 else ''}"
-                    else:
-                        months = remaining_days // 30
-                        return f"{years} year{'s' if years > 1 else ''} and {months} month{'s' if months > 1 else ''}"
-                        
-            except ValueError:
+            if start is None or end is None:
                 return "Date format error - please use YYYY-MM-DD format"
+            
+            return _humanize_days((end - start).days)
+        
+        def _parse_response_dates(self) -> Dict[str, Optional[datetime]]:
+            """Parse each date answer once; missing or malformed dates map to None."""
+            return {field: _parse_date(self.responses.get(field, "")) for field in DATE_FIELDS}
         
         def _validate_date_format(self, date_string: str) -> bool:
             """Validate if a string is in YYYY-MM-DD format."""
-            try:
-                datetime.strptime(date_string, "%Y-%m-%d")
-                return True
-            except ValueError:
-                return False
+            return _parse_date(date_string) is not None
         
-        def _validate_date_range(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        def _validate_date_range(self, start: Optional[datetime], end: Optional[datetime]) -> Dict[str, Any]:
             """Validate date range (start before end, not in future, not too old)."""
-            try:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d")
-                today = datetime.now()
-                
-                validation_result = {
-                    "is_valid": True,
-                    "warnings": [],
-                    "errors": []
-                }
-                
-                # Check if start is before end
-                if start >= end:
-                    validation_result["is_valid"] = False
-                    validation_result["errors"].append("Start date must be before end date")
-                
-                # Check if dates are in the future
-                if start > today:
-                    validation_result["warnings"].append("Start date is in the future")
-                
-                if end > today:
-                    validation_result["warnings"].append("End date is in the future")
-                
-                # Check if dates are too old (more than 5 years ago)
-                five_years_ago = today.replace(year=today.year - 5)
-                if start < five_years_ago:
-                    validation_result["warnings"].append("Start date is more than 5 years ago")
-                
-                if end < five_years_ago:
-                    validation_result["warnings"].append("End date is more than 5 years ago")
-                
-                return validation_result
-                
-            except ValueError:
+            if start is None or end is None:
                 return {
                     "is_valid": False,
                     "warnings": [],
                     "errors": ["Invalid date format"]
                 }
+            
+            today = datetime.now()
+            
+            validation_result = {
+                "is_valid": True,
+                "warnings": [],
+                "errors": []
+            }
+            
+            # Check if start is before end
+            if start >= end:
+                validation_result["is_valid"] = False
+                validation_result["errors"].append("Start date must be before end date")
+            
+            # Check if dates are in the future
+            if start > today:
+                validation_result["warnings"].append("Start date is in the future")
+            
+            if end > today:
+                validation_result["warnings"].append("End date is in the future")
+            
+            # Check if dates are too old (more than 5 years ago); on Feb 29 the
+            # cutoff falls back to Feb 28, since 5 years earlier is not a leap year
+            try:
+                five_years_ago = today.replace(year=today.year - 5)
+            except ValueError:
+                five_years_ago = today.replace(year=today.year - 5, day=28)
+            if start < five_years_ago:
+                validation_result["warnings"].append("Start date is more than 5 years ago")
+            
+            if end < five_years_ago:
+                validation_result["warnings"].append("End date is more than 5 years ago")
+            
+            return validation_result
         
 
         
         def display_analysis(self):
             """Display the analysis results for experiment monitoring."""
-            print(f"\n{'='*80}")
-            print(f"                    EXPERIMENT MONITORING - ANALYSIS RESULTS")
-            print(f"{'='*80}")
+            # Build the whole report first and write it in one go
+            lines = list(ANALYSIS_HEADER)
             
             # Display each analysis section
             for section, data in self.analysis_results.items():
                 if section == "overall_assessment":
                     continue  # Handle this separately
                 
-                print(f"\n{section.replace('_', ' ').title()}:")
-                print("-" * 60)
+                lines.append(f"\n{format_heading(section)}:")
+                lines.append(SECTION_RULE)
                 
                 if isinstance(data, dict):
                     for key, value in data.items():
                         if isinstance(value, list):
-                            print(f"  {key.replace('_', ' ').title()}:")
+                            lines.append(f"  {format_heading(key)}:")
                             for item in value:
-                                print(f"    • {item}")
+                                lines.append(f"    • {item}")
                         elif isinstance(value, dict):
-                            print(f"  {key.replace('_', ' ').title()}:")
+                            lines.append(f"  {format_heading(key)}:")
                             for sub_key, sub_value in value.items():
                                 if isinstance(sub_value, list):
-                                    print(f"    {sub_key.replace('_', ' ').title()}:")
+                                    lines.append(f"    {format_heading(sub_key)}:")
                                     for item in sub_value:
-                                        print(f"      • {item}")
+                                        lines.append(f"      • {item}")
                                 elif isinstance(sub_value, dict) and sub_key in ["date_validation", "timing_validation"]:
-                                    print(f"    {sub_key.replace('_', ' ').title()}:")
+                                    lines.append(f"    {format_heading(sub_key)}:")
                                     validation = sub_value
                                     if validation.get("is_valid"):
                                         if sub_key == "date_validation":
-                                            print(f"      ✓ Valid date range")
+                                            lines.append(f"      ✓ Valid date range")
                                         else:
-                                            print(f"      ✓ Valid timing relationship")
+                                            lines.append(f"      ✓ Valid timing relationship")
                                     else:
                                         if sub_key == "date_validation":
-                                            print(f"      ✗ Invalid date range")
+                                            lines.append(f"      ✗ Invalid date range")
                                         else:
-                                            print(f"      ✗ Invalid timing relationship")
+                                            lines.append(f"      ✗ Invalid timing relationship")
                                     
                                     if validation.get("warnings"):
-                                        print(f"      Warnings:")
+                                        lines.append(f"      Warnings:")
                                         for warning in validation["warnings"]:
-                                            print(f"        • {warning}")
+                                            lines.append(f"        • {warning}")
                                     
                                     if validation.get("errors"):
-                                        print(f"      Errors:")
+                                        lines.append(f"      Errors:")
                                         for error in validation["errors"]:
-                                            print(f"        • {error}")
+                                            lines.append(f"        • {error}")
                                 else:
-                                    print(f"    {sub_key.replace('_', ' ').title()}: {sub_value}")
+                                    lines.append(f"    {format_heading(sub_key)}: {sub_value}")
                         else:
-                            print(f"  {key.replace('_', ' ').title()}: {value}")
+                            lines.append(f"  {format_heading(key)}: {value}")
                 else:
-                    print(f"  {data}")
+                    lines.append(f"  {data}")
             
             # Display overall assessment
             overall = self.analysis_results.get("overall_assessment", {})
             if overall:
-                print(f"\n{'Overall Assessment':-^80}")
-                print(f"Complexity Level: {overall.get('complexity_level', 'Unknown')}")
-                print(f"Complexity Score: {overall.get('complexity_score', 'Unknown')}")
-                print(f"Monitoring Scope: {overall.get('monitoring_scope', 'Unknown')}")
-                print(f"Experiment Readiness: {overall.get('experiment_readiness', 'Unknown')}")
+                lines.append(OVERALL_ASSESSMENT_BANNER)
+                lines.append(f"Complexity Level: {overall.get('complexity_level', 'Unknown')}")
+                lines.append(f"Complexity Score: {overall.get('complexity_score', 'Unknown')}")
+                lines.append(f"Monitoring Scope: {overall.get('monitoring_scope', 'Unknown')}")
+                lines.append(f"Experiment Readiness: {overall.get('experiment_readiness', 'Unknown')}")
                 
-                print(f"\nKey Recommendations:")
+                lines.append(f"\nKey Recommendations:")
                 for rec in overall.get('key_recommendations', []):
-                    print(f"  • {rec}")
+                    lines.append(f"  • {rec}")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
         
 
         
-        def save_results(self, filename: Optional[str] = None):
-            """Save results to a JSON file (simplified version)."""
+        def save_results(self, filename: Optional[str] = None, pretty: bool = False):
+            """Save results to a compact JSON file, or an indented one if pretty is set."""
+            now = datetime.now()
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"experiment_monitoring_{timestamp}.json"
             
             try:
                 results = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
                     "question_set": "experiment_monitoring",
                     "set_info": {
                         "name": "Experiment Monitoring Questionnaire",
@@ -543,8 +747,7 @@ def create_experiment_questionnaire_class():
                     "analysis": self.analysis_results
                 }
                 
-                with open(filename, 'w') as f:
-                    json.dump(results, f, indent=2)
+                write_json(filename, results, pretty=pretty)
                 
                 print(f"\nResults saved to: {filename}")
             except Exception as e:
@@ -559,8 +762,9 @@ def create_experiment_questionnaire_class():
             print(f"\nStarting Experiment Monitoring Questionnaire...")
             print("=" * 60)
             
+            total = len(self.questions)
             for i, question in enumerate(self.questions, 1):
-                print(f"\nQuestion {i} of {len(self.questions)}")
+                print(f"\nQuestion {i} of {total}")
                 print()
                 print(question["question"])
                 
@@ -575,7 +779,6 @@ def create_experiment_questionnaire_class():
                 
                 # Show progress
                 completed = len(self.responses)
-                total = len(self.questions)
                 progress = (completed / total) * 100
                 print(f"\nProgress: {completed}/{total} questions completed ({progress:.1f}%)")
                 print()
@@ -624,8 +827,7 @@ def create_experiment_questionnaire_class():
         
         def _is_date_question(self, question: Dict[str, Any]) -> bool:
             """Check if a question is asking for a date."""
-            date_questions = ["test_start_date", "test_end_date", "control_start_date", "control_end_date"]
-            return question["id"] in date_questions
+            return question["id"] in DATE_QUESTION_IDS
         
         def _validate_date_input(self, date_input: str, question: Dict[str, Any], question_number: int) -> Dict[str, Any]:
             """Validate a single date input."""
@@ -650,22 +852,19 @@ def create_experiment_questionnaire_class():
                     start_date = self.responses.get("control_start_date", "")
                 
                 if start_date:
-                    range_validation = self._validate_date_range(start_date, date_input)
+                    end_dt = _parse_date(date_input)
+                    range_validation = self._validate_date_range(_parse_date(start_date), end_dt)
                     
                     # Additional validation for control_end_date to prevent overlap with test period
                     if question["id"] == "control_end_date":
                         test_start = self.responses.get("test_start_date", "")
                         if test_start:
-                            try:
-                                control_end_dt = datetime.strptime(date_input, "%Y-%m-%d")
-                                test_start_dt = datetime.strptime(test_start, "%Y-%m-%d")
-                                if control_end_dt >= test_start_dt:
-                                    range_validation["is_valid"] = False
-                                    range_validation["errors"].append(
-                                        "Control period end date cannot be on or after test period start date"
-                                    )
-                            except ValueError:
-                                pass
+                            test_start_dt = _parse_date(test_start)
+                            if end_dt is not None and test_start_dt is not None and end_dt >= test_start_dt:
+                                range_validation["is_valid"] = False
+                                range_validation["errors"].append(
+                                    "Control period end date cannot be on or after test period start date"
+                                )
                     
                     return range_validation
                 else:
@@ -685,101 +884,80 @@ def create_experiment_questionnaire_class():
             if current_question_number >= 5 and test_start and test_end:
                 # We have test period, check if control period overlaps
                 if control_start and control_end:
-                    return self._validate_experiment_timing(control_start, control_end, test_start, test_end)
+                    return self._validate_experiment_timing(
+                        _parse_date(control_start), _parse_date(control_end),
+                        _parse_date(test_start), _parse_date(test_end)
+                    )
                 elif control_start:
                     # We have control start and test period, check if control start is after test start
-                    try:
-                        control_start_dt = datetime.strptime(control_start, "%Y-%m-%d")
-                        test_start_dt = datetime.strptime(test_start, "%Y-%m-%d")
-                        if control_start_dt >= test_start_dt:
-                            return {
-                                "is_valid": False,
-                                "warnings": [],
-                                "errors": ["Control period start date cannot be on or after test period start date"]
-                            }
-                    except ValueError:
-                        pass
+                    control_start_dt = _parse_date(control_start)
+                    test_start_dt = _parse_date(test_start)
+                    if control_start_dt is not None and test_start_dt is not None and control_start_dt >= test_start_dt:
+                        return {
+                            "is_valid": False,
+                            "warnings": [],
+                            "errors": ["Control period start date cannot be on or after test period start date"]
+                        }
             
             return None
         
-        def _validate_experiment_timing(self, control_start: str, control_end: str, test_start: str, test_end: str) -> Dict[str, Any]:
+        def _validate_experiment_timing(self, control_start: Optional[datetime], control_end: Optional[datetime],
+                                        test_start: Optional[datetime], test_end: Optional[datetime]) -> Dict[str, Any]:
             """Validate the timing relationship between control and test periods."""
-            try:
-                control_start_dt = datetime.strptime(control_start, "%Y-%m-%d")
-                control_end_dt = datetime.strptime(control_end, "%Y-%m-%d")
-                test_start_dt = datetime.strptime(test_start, "%Y-%m-%d")
-                test_end_dt = datetime.strptime(test_end, "%Y-%m-%d")
-                
-                validation_result = {
-                    "is_valid": True,
-                    "warnings": [],
-                    "errors": []
-                }
-                
-                # Check if control period ends before test period begins
-                if control_end_dt >= test_start_dt:
-                    validation_result["is_valid"] = False
-                    validation_result["errors"].append(
-                        "Control period should end before test period begins for proper baseline comparison"
-                    )
-                
-                # Check for gaps between control and test periods
-                gap_days = (test_start_dt - control_end_dt).days
-                if gap_days > 30:
-                    validation_result["warnings"].append(
-                        f"Large gap ({gap_days} days) between control and test periods may affect comparison validity"
-                    )
-                elif gap_days < 0:
-                    validation_result["warnings"].append(
-                        "Control and test periods overlap - this may invalidate your baseline comparison"
-                    )
-                
-                # Check if control period is too close to test period
-                if 0 <= gap_days <= 7:
-                    validation_result["warnings"].append(
-                        "Very small gap between control and test periods - ensure no carryover effects"
-                    )
-                
-                return validation_result
-                
-            except ValueError:
+            if None in (control_start, control_end, test_start, test_end):
                 return {
                     "is_valid": False,
                     "warnings": [],
                     "errors": ["Date format error - cannot validate timing relationship"]
                 }
+            
+            validation_result = {
+                "is_valid": True,
+                "warnings": [],
+                "errors": []
+            }
+            
+            # Parsed answers are all midnights, so the whole-day gap between the
+            # periods decides every check below
+            gap_days = (test_start - control_end).days
+            
+            # Check if control period ends before test period begins
+            if gap_days <= 0:
+                validation_result["is_valid"] = False
+                validation_result["errors"].append(
+                    "Control period should end before test period begins for proper baseline comparison"
+                )
+            
+            # Check for overlaps, and for gaps that are too small or too large
+            if gap_days < 0:
+                validation_result["warnings"].append(
+                    "Control and test periods overlap - this may invalidate your baseline comparison"
+                )
+            elif gap_days <= 7:
+                validation_result["warnings"].append(
+                    "Very small gap between control and test periods - ensure no carryover effects"
+                )
+            elif gap_days > 30:
+                validation_result["warnings"].append(
+                    f"Large gap ({gap_days} days) between control and test periods may affect comparison validity"
+                )
+            
+            return validation_result
         
 
         
         def _compile_all_metrics(self, selected_metrics: List[str], custom_metrics: str) -> List[str]:
             """Compile all metrics for analysis."""
-            all_metrics = selected_metrics.copy()
+            # Without "All metrics from above" the selection is already complete
+            if ALL_METRICS_OPTION not in selected_metrics:
+                return selected_metrics.copy()
             
-            # Handle "All metrics from above" selection
-            if "All metrics from above" in all_metrics:
-                # Remove the "All metrics from above" option
-                all_metrics.remove("All metrics from above")
-                # Add all individual metrics
-                individual_metrics = [
-                    "Authed GMV",
-                    "Checkouts",
-                    "E2E Conversion",
-                    "AOV",
-                    "Application Rate",
-                    "Authentication Rate",
-                    "Approval Rate",
-                    "Take-up Rate",
-                    "Auth Rate",
-                    "Median FICO",
-                    "% Prime+ Population",
-                    "Median ITACS",
-                    "Terms distribution",
-                    "% Z-term"
-                ]
-                # Add individual metrics (avoiding duplicates)
-                for metric in individual_metrics:
-                    if metric not in all_metrics:
-                        all_metrics.append(metric)
+            # Replace the "All metrics from above" option with every individual
+            # metric that was not already selected
+            all_metrics = selected_metrics.copy()
+            all_metrics.remove(ALL_METRICS_OPTION)
+            already_selected = set(all_metrics)
+            all_metrics.extend(metric for metric in ALL_METRICS if metric not in already_selected)
             
             # Remove any "Other" options if they exist
             
@@ -787,59 +965,24 @@ def create_experiment_questionnaire_class():
         
         def _categorize_metrics(self, metrics: List[str]) -> Dict[str, List[str]]:
             """Categorize metrics by type."""
-            categories = {
-                "Financial Metrics": ["Authed GMV", "AOV"],
-                "Conversion Metrics": ["Checkouts", "E2E Conversion", "Application Rate", "Authentication Rate", "Approval Rate", "Take-up Rate", "Auth Rate"],
-                "Credit Quality Metrics": ["Median FICO", "% Prime+ Population", "Median ITACS"],
-                "Product Metrics": ["Terms distribution", "% Z-term"]
-            }
-            
-            categorized = {}
-            for category, category_metrics in categories.items():
-                found_metrics = [metric for metric in metrics if metric in category_metrics]
-                if found_metrics:
-                    categorized[category] = found_metrics
-            
-            # Add uncategorized metrics
-            all_categorized = [metric for metrics_list in categorized.values() for metric in metrics_list]
-            uncategorized = [metric for metric in metrics if metric not in all_categorized]
-            if uncategorized:
-                categorized["Other/Uncategorized"] = uncategorized
+            grouped = {}
+            for metric in metrics:
+                grouped.setdefault(METRIC_CATEGORY.get(metric, UNCATEGORIZED_METRICS), []).append(metric)
             
-            return categorized
+            # Report categories in their fixed order, with uncategorized metrics last
+            return {
+                category: grouped[category]
+                for category in (*METRIC_CATEGORIES, UNCATEGORIZED_METRICS)
+                if category in grouped
+            }
         
         def _get_metric_description(self, metric: str) -> str:
             """Get description and calculation guidance for a metric."""
-            descriptions = {
-                "Authed GMV": "Gross Merchandise Value from authenticated users - Total transaction value after user authentication",
-                "Checkouts": "Number of completed checkout processes - Count of users who reached checkout completion",
-                "E2E Conversion": "End-to-end conversion rate - Users who complete the full journey from start to finish",
-                "AOV": "Average Order Value - Total revenue divided by number of orders",
-                "Application Rate": "Rate of users who submit applications - Applications submitted / total users",
-                "Authentication Rate": "Rate of successful user authentications - Successful auths / total attempts",
-                "Approval Rate": "Rate of approved applications - Approved applications / total applications",
-                "Take-up Rate": "Rate of users who accept offers - Accepted offers / total offers presented",
-                "Auth Rate": "Overall authentication success rate - Successful authentications / total attempts",
-                "Median FICO": "Median FICO score of users - Middle value of all user FICO scores",
-                "% Prime+ Population": "Percentage of users with Prime+ status - Prime+ users / total users",
-                "Median ITACS": "Median ITACS score of users - Middle value of all user ITACS scores",
-                "Terms distribution": "Distribution of loan terms selected - Breakdown of term lengths chosen",
-                "% Z-term": "Percentage of zero-term or immediate transactions - Zero-term transactions / total transactions"
-            }
-            return descriptions.get(metric, "Metric description not available")
+            return METRIC_DESCRIPTIONS.get(metric, "Metric description not available")
         
         def _assess_monitoring_complexity(self, metric_count: int) -> str:
             """Assess the complexity of monitoring based on metric count."""
-            if metric_count == 0:
-                return "No metrics selected - monitoring not possible"
-            elif metric_count <= 3:
-                return "Low complexity - easy to monitor and analyze"
-            elif metric_count <= 7:
-                return "Medium complexity - manageable monitoring"
-            elif metric_count <= 12:
-                return "High complexity - requires organized monitoring approach"
-            else:
-                return "Very high complexity - consider monitoring dashboard or tools"
+            return MONITORING_COMPLEXITIES[bisect_right(MONITORING_COMPLEXITY_THRESHOLDS, metric_count)]
         
         def _compile_all_goals(self, selected_goals: List[str], custom_goals: str) -> List[str]:
             """Compile all experiment goals for analysis."""
@@ -847,7 +990,7 @@ def create_experiment_questionnaire_class():
             
             if custom_goals and "Other" in selected_goals:
                 # Parse custom goals (assuming comma-separated or newline-separated)
-                custom_list = [goal.strip() for goal in custom_goals.replace('\n', ',').split(',') if goal.strip()]
+                custom_list = [goal.strip() for goal in GOAL_SEPARATOR_RE.split(custom_goals) if goal.strip()]
                 all_goals.extend(custom_list)
                 # Remove the placeholder "Other" option
             
@@ -858,29 +1001,12 @@ def create_experiment_questionnaire_class():
             if not goals or not metrics:
                 return "Cannot assess alignment - missing goals or metrics"
             
-            # Define goal-metric mappings
-            goal_metric_mapping = {
-                "Increase conversion rates": ["E2E Conversion", "Application Rate", "Approval Rate", "Take-up Rate"],
-                "Improve user engagement": ["Checkouts", "Authentication Rate", "Auth Rate"],
-                "Reduce customer acquisition costs": ["Application Rate", "Authentication Rate"],
-                "Increase average order value": ["AOV", "Authed GMV"],
-                "Improve customer satisfaction": ["E2E Conversion", "Take-up Rate"],
-                "Test new features or designs": ["Checkouts", "E2E Conversion", "Application Rate"],
-                "Optimize pricing strategy": ["AOV", "Authed GMV", "Terms distribution", "% Z-term"],
-                "Improve checkout process": ["Checkouts", "E2E Conversion", "Application Rate"],
-                "Test APR/pricing changes": ["AOV", "Authed GMV", "Terms distribution", "% Z-term", "Take-up Rate"],
-                "Improve credit approval rates": ["Approval Rate", "Median FICO", "% Prime+ Population", "Median ITACS"],
-                "Increase loan take-up": ["Take-up Rate", "E2E Conversion", "Application Rate"],
-                "Optimize risk assessment": ["Median FICO", "% Prime+ Population", "Median ITACS", "Approval Rate"]
-            }
-            
-            # Count aligned goals
-            aligned_count = 0
-            for goal in goals:
-                if goal in goal_metric_mapping:
-                    goal_metrics = goal_metric_mapping[goal]
-                    if any(metric in metrics for metric in goal_metrics):
-                        aligned_count += 1
+            # A goal is aligned if at least one of its metrics was selected
+            selected_metrics = set(metrics)
+            aligned_count = sum(
+                1 for goal in goals
+                if not GOAL_METRICS.get(goal, NO_GOAL_METRICS).isdisjoint(selected_metrics)
+            )
             
             alignment_percentage = (aligned_count / len(goals)) * 100
             
@@ -895,15 +1021,11 @@ def create_experiment_questionnaire_class():
         
         def _assess_measurability(self, success_criteria: str) -> str:
             """Assess how measurable the success criteria are."""
-            measurable_keywords = ["increase", "decrease", "improve", "reduce", "achieve", "reach", "maintain", "exceed"]
-            percentage_keywords = ["%", "percent", "percentage"]
-            number_keywords = ["number", "count", "amount", "value", "rate"]
-            
             criteria_lower = success_criteria.lower()
             
-            has_measurable_terms = any(keyword in criteria_lower for keyword in measurable_keywords)
-            has_percentages = any(keyword in criteria_lower for keyword in percentage_keywords)
-            has_numbers = any(keyword in criteria_lower for keyword in number_keywords)
+            has_measurable_terms = MEASURABLE_TERMS_RE.search(criteria_lower) is not None
+            has_percentages = PERCENTAGE_TERMS_RE.search(criteria_lower) is not None
+            has_numbers = NUMBER_TERMS_RE.search(criteria_lower) is not None
             
             if has_percentages and has_measurable_terms:
                 return "Highly measurable - specific percentage targets with clear direction"
@@ -921,13 +1043,12 @@ def create_experiment_questionnaire_class():
             
             # Simple keyword matching
             criteria_lower = success_criteria.lower()
-            metrics_lower = [metric.lower() for metric in metrics]
             
-            # Check if criteria mention any of the selected metrics
-            mentioned_metrics = [metric for metric in metrics_lower if metric in criteria_lower]
+            # Count the selected metrics the criteria mention
+            mentioned_count = sum(1 for metric in metrics if metric.lower() in criteria_lower)
             
-            if mentioned_metrics:
-                return f"Good alignment - criteria mention {len(mentioned_metrics)} selected metrics"
+            if mentioned_count:
+                return f"Good alignment - criteria mention {mentioned_count} selected metrics"
             else:
                 return "Limited alignment - consider ensuring success criteria reference selected metrics"
         
@@ -988,7 +1109,6 @@ def create_experiment_questionnaire_class():
                         ], capture_output=True, text=True)
                         
                         if result.returncode == 0:
-                            import json
                             mcp_response = json.loads(result.stdout)
                             print(f"✅ {mcp_response.get('message', 'MCP preparation complete')}")
                             
@@ -1019,72 +1139,31 @@ def create_experiment_questionnaire_class():
             except Exception as e:
                 print(f"\nAn error occurred: {e}")
         
-        def _generate_experiment_assessment(self) -> Dict[str, Any]:
-            """Generate overall experiment assessment."""
-            # Calculate complexity score
-            complexity_score = 0
-            
-            # ARI complexity
-            ari_count = len(self._compile_all_aris(
-                self.responses.get("merchant_aris", "")
-            ))
-            if ari_count > 10:
-                complexity_score += 2
-            elif ari_count > 5:
-                complexity_score += 1
-            
-            # Metrics complexity
-            metrics_count = len(self._compile_all_metrics(
-                self.responses.get("metrics_to_monitor", []),
-                ""
-            ))
-            if metrics_count > 10:
-                complexity_score += 2
-            elif metrics_count > 5:
-                complexity_score += 1
+        def _generate_experiment_assessment(self, ari_count: int, metrics_count: int,
+                                            dates: Dict[str, Optional[datetime]]) -> Dict[str, Any]:
+            """Generate overall experiment assessment from the ARI and metric counts and parsed dates."""
+            responses = self.responses
+            
+            # Calculate complexity score from the ARI and metrics complexity
+            complexity_score = (
+                bisect_right(COUNT_COMPLEXITY_THRESHOLDS, ari_count)
+                + bisect_right(COUNT_COMPLEXITY_THRESHOLDS, metrics_count)
+            )
             
             # Control period complexity
-            control_start_date = self.responses.get("control_start_date", "")
-            control_end_date = self.responses.get("control_end_date", "")
+            control_start_date = responses.get("control_start_date", "")
+            control_end_date = responses.get("control_end_date", "")
             if control_start_date and control_end_date:
-                try:
-                    start = datetime.strptime(control_start_date, "%Y-%m-%d")
-                    end = datetime.strptime(control_end_date, "%Y-%m-%d")
-                    control_duration = (end - start).days
-                    if control_duration < 14:  # Short control periods add complexity
-                        complexity_score += 1
-                except ValueError:
+                start = dates["control_start_date"]
+                end = dates["control_end_date"]
+                if start is None or end is None:
                     complexity_score += 1  # Invalid dates add complexity
+                elif (end - start).days < 14:  # Short control periods add complexity
+                    complexity_score += 1
             
-            # Determine complexity level
-            if complexity_score >= 4:
-                complexity_level = "High"
-            elif complexity_score >= 2:
-                complexity_level = "Medium"
-            else:
-                complexity_level = "Low"
-            
-            # Generate recommendations
-            recommendations = []
-            if complexity_level == "High":
-                recommendations.extend([
-                    "Consider using monitoring dashboards or tools",
-                    "Implement automated reporting systems",
-                    "Establish clear monitoring schedules",
-                    "Consider breaking into smaller experiments"
-                ])
-            elif complexity_level == "Medium":
-                recommendations.extend([
-                    "Use organized monitoring approaches",
-                    "Establish regular review cycles",
-                    "Consider monitoring templates"
-                ])
-            else:
-                recommendations.extend([
-                    "Standard monitoring approach should be sufficient",
-                    "Focus on data quality and consistency",
-                    "Establish baseline measurements"
-                ])
+            # Level, readiness and base recommendations are precomputed per score
+            complexity_level, experiment_readiness, base_recommendations = EXPERIMENT_ASSESSMENTS[complexity_score]
+            recommendations = list(base_recommendations)
             
             # Add specific recommendations based on responses
             if ari_count > 10:
@@ -1093,59 +1172,31 @@ def create_experiment_questionnaire_class():
             if metrics_count > 10:
                 recommendations.append("Many metrics - consider grouping or prioritization")
             
-            if not self.responses.get("additional_context"):
-                recommendations.append("Provide additional context for better experiment evaluation")
+            recommendations.extend(
+                recommendation for question_id, recommendation in MISSING_ANSWER_RECOMMENDATIONS
+                if not responses.get(question_id)
+            )
             
             # Add ARI type specific recommendations
-            ari_type = self.responses.get("ari_type", "")
-            if ari_type == "Merchant Partner ARIs":
-                recommendations.append("Partner ARIs selected - ensure proper data access and permissions")
+            ari_type_recommendation = ARI_TYPE_RECOMMENDATIONS.get(responses.get("ari_type", ""))
+            if ari_type_recommendation:
+                recommendations.append(ari_type_recommendation)
             
             return {
                 "complexity_level": complexity_level,
                 "complexity_score": complexity_score,
-                "monitoring_scope": "Large" if ari_count > 10 or metrics_count > 10 else "Medium" if ari_count > 5 or metrics_count > 5 else "Small",
+                "monitoring_scope": ASSESSMENT_SCOPES[bisect_right(COUNT_COMPLEXITY_THRESHOLDS, max(ari_count, metrics_count))],
                 "key_recommendations": recommendations,
-                "experiment_readiness": "Ready" if complexity_level != "High" else "Needs Planning"
+                "experiment_readiness": experiment_readiness
             }
         
         def _assess_segmentation_complexity(self, segmentation: List[str]) -> str:
             """Assess the complexity of monitoring based on segmentation choices."""
-            if "Overall" in segmentation and len(segmentation) == 1:
-                return "Low complexity - overall monitoring only"
-            elif len(segmentation) <= 2:
-                return "Medium complexity - manageable segmentation"
-            elif len(segmentation) <= 4:
-                return "High complexity - consider monitoring tools and dashboards"
-            else:
-                return "Very high complexity - requires dedicated monitoring infrastructure"
+            return _segmentation_complexity(frozenset(segmentation), len(segmentation))
         
         def _analyze_segmentation_implications(self, segmentation: List[str]) -> str:
             """Analyze the implications of chosen segmentation."""
-            implications = []
-            
-            if "Overall" in segmentation:
-                implications.append("Overall monitoring provides baseline performance")
-            
-            if "NTA vs. Repeat" in segmentation:
-                implications.append("Customer type segmentation - useful for understanding new vs. existing customer behavior")
-            
-            if "FICO Bands" in segmentation:
-                implications.append("Credit quality segmentation - important for risk assessment and approval patterns")
-            
-            if "AOV Bands" in segmentation:
-                implications.append("Transaction value segmentation - useful for understanding spending behavior")
-            
-            if "ITACS Bands" in segmentation:
-                implications.append("Income segmentation - important for affordability and loan sizing")
-            
-            if "Loan Type (IB vs. 0%)" in segmentation:
-                implications.append("Product segmentation - critical for understanding product preference and performance")
-            
-            if len(implications) == 1:
-                return implications[0]
-            else:
-                return "Multiple segmentation approaches: " + "; ".join(implications)
+            return _segmentation_implications(frozenset(segmentation))
         
         def generate_populated_sql(self) -> str:
             """Generate a populated SQL query based on questionnaire responses."""
@@ -1246,7 +1297,6 @@ group by all
         def save_sql_query(self, filename: str = None) -> str:
             """Save the generated SQL query to a file."""
             if not filename:
-                from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"experiment_query_{timestamp}.sql"
             
@@ -1262,7 +1312,6 @@ group by all
             """Open the SQL file in Cursor IDE."""
             try:
                 import subprocess
-                import os
                 
                 # Try different methods to open in Cursor
                 cursor_commands = ["cursor", "code"]
@@ -1377,7 +1426,6 @@ group by all
             """Execute SQL via MCP Snowflake interface (fallback method)."""
             try:
                 import subprocess
-                import json
                 import tempfile
                 
                 base_sql = self.generate_populated_sql()
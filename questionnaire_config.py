@@ -379,23 +379,34 @@ def create_custom_question_set(name: str, description: str, questions: list, cat
     }
     return custom_set
 
+def _has_options(question: dict) -> bool:
+    """Choice-based questions need a non-empty list of options."""
+    return bool(question.get("options"))
+
+def _accept(question: dict) -> bool:
+    """Question types with no type-specific requirements."""
+    return True
+
+# Question types that choose from a list of options
+OPTION_QUESTION_TYPES = frozenset({"multiple_choice", "multi_select"})
+
+# Type-specific validator for each entry in QUESTION_TYPES, built from it so
+# the two can never disagree about which types are valid
+QUESTION_VALIDATORS = {
+    question_type: _has_options if question_type in OPTION_QUESTION_TYPES else _accept
+    for question_type in QUESTION_TYPES
+}
+
 def validate_question_format(question: dict) -> bool:
     """Validate that a question has the required format."""
-    required_fields = ["id", "question", "type"]
-    question_types = list(QUESTION_TYPES.keys())
-    
     # Check required fields
-    for field in required_fields:
-        if field not in question:
-            return False
-    
-    # Check question type
-    if question["type"] not in question_types:
+    if "id" not in question or "question" not in question or "type" not in question:
         return False
     
-    # Check options for choice-based questions
-    if question["type"] in ["multiple_choice", "multi_select"]:
-        if "options" not in question or not question["options"]:
-            return False
-    
-    return True
+    # Check question type, then any type-specific requirements
+    validator = QUESTION_VALIDATORS.get(question["type"])
+    return validator is not None and validator(question)
+
+def find_invalid_questions(questions: list) -> list:
+    """Return the indices of questions that fail validate_question_format."""
+    return [i for i, question in enumerate(questions) if not validate_question_format(question)]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared Snowflake Session
+
+Holds one authenticated Snowflake connection per process so that repeated
+checks reuse the same session instead of re-authenticating (which, with the
+default externalbrowser authenticator, means another SSO popup every time).
+"""
+
+import atexit
+import os
+from contextlib import contextmanager
+
+_connection = None
+
+
+def _connect():
+    """Open a new Snowflake connection from environment settings."""
+    # Imported here so that importing this module stays cheap
+    from snowflake.connector import connect
+
+    account = os.environ.get('SNOWFLAKE_ACCOUNT')
+    user = os.environ.get('SNOWFLAKE_USER')
+    authenticator = os.environ.get('SNOWFLAKE_AUTHENTICATOR', 'externalbrowser')
+    warehouse = os.environ.get('SNOWFLAKE_WAREHOUSE', 'SHARED')
+
+    # Keep the session alive between checks so it never has to
+    # re-authenticate, and scope metadata requests to the current context
+    conn = connect(
+        account=account,
+        user=user,
+        authenticator=authenticator,
+        warehouse=warehouse,
+        client_session_keep_alive=True,
+        client_prefetch_threads=8,
+        client_metadata_request_use_connection_ctx=True,
+        session_parameters={
+            "USE_CACHED_RESULT": True,
+            "STATEMENT_TIMEOUT_IN_SECONDS": 30
+        }
+    )
+    return conn
+
+
+def _is_connection_alive(conn) -> bool:
+    """Run a trivial query to check that the session is still usable."""
+    from snowflake.connector.errors import OperationalError, ProgrammingError
+
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        finally:
+            cursor.close()
+        return True
+    except (ProgrammingError, OperationalError):
+        return False
+
+
+def _close_connection():
+    """Close the process-wide connection, if one is open."""
+    global _connection
+
+    if _connection is not None:
+        if not _connection.is_closed():
+            _connection.close()
+        _connection = None
+
+
+@contextmanager
+def snowflake_session():
+    """Yield the process-wide Snowflake connection, connecting on first use."""
+    global _connection
+
+    if _connection is None or _connection.is_closed() or not _is_connection_alive(_connection):
+        # Release a stale session before replacing it
+        _close_connection()
+        _connection = _connect()
+
+    yield _connection
+
+
+atexit.register(_close_connection)
@@ -256,23 +256,23 @@ def create_experiment_questionnaire_class():
                     "clarity_assessment": self._assess_description_clarity(experiment_desc)
                 }
             
-            # Merchant ARIs Analysis  
+            # Merchant ARIs Analysis (the count is also used by the overall assessment)
             merchant_aris = self.responses.get("merchant_aris", "")
             ari_type = self.responses.get("ari_type", "")
+            ari_count = len(self._compile_all_aris(merchant_aris))
             if merchant_aris and ari_type:
-                all_aris = self._compile_all_aris(merchant_aris)
                 self.analysis_results["merchant_ari_analysis"] = {
                     "ari_list": merchant_aris,
                     "ari_type": ari_type,
-                    "total_aris": len(all_aris),
-                    "monitoring_scope": self._assess_monitoring_scope(len(all_aris))
+                    "total_aris": ari_count,
+                    "monitoring_scope": self._assess_monitoring_scope(ari_count)
                 }
             
-            # SQL Metrics Analysis
+            # SQL Metrics Analysis (the count is also used by the overall assessment)
             metrics = self.responses.get("metrics_to_monitor", [])
             custom_metrics = self.responses.get("custom_metrics", "")
+            all_metrics = self._compile_all_metrics(metrics, custom_metrics)
             if metrics or custom_metrics:
-                all_metrics = self._compile_all_metrics(metrics, custom_metrics)
                 self.analysis_results["sql_metrics_analysis"] = {
                     "selected_metrics": metrics,
                     "custom_metrics": custom_metrics,
@@ -282,7 +282,7 @@ def create_experiment_questionnaire_class():
                 }
             
             # Generate overall assessment
-            self.analysis_results["overall_assessment"] = self._generate_experiment_assessment()
+            self.analysis_results["overall_assessment"] = self._generate_experiment_assessment(ari_count, len(all_metrics))
         
         # Include all the helper methods from the original questionnaire
         def _assess_description_clarity(self, description: str) -> str:
@@ -334,13 +334,13 @@ def create_experiment_questionnaire_class():
         
         def _compile_all_metrics(self, selected_metrics: List[str], custom_metrics: str) -> List[str]:
             """Compile all metrics for analysis."""
-            all_metrics = selected_metrics.copy()
+            if not (custom_metrics and "Other" in selected_metrics):
+                return selected_metrics.copy()
             
-            if custom_metrics and "Other" in selected_metrics:
-                custom_list = [metric.strip() for metric in custom_metrics.replace('\n', ',').split(',') if metric.strip()]
-                all_metrics.extend(custom_list)
-                if "Other (specify below)" in all_metrics:
-                    all_metrics.remove("Other (specify below)")
+            # Drop the placeholder option in the same pass that copies the selection
+            custom_list = [metric.strip() for metric in custom_metrics.replace('\n', ',').split(',') if metric.strip()]
+            all_metrics = [metric for metric in selected_metrics if metric != "Other (specify below)"]
+            all_metrics.extend(custom_list)
             
             return all_metrics
         
@@ -357,24 +357,17 @@ def create_experiment_questionnaire_class():
             else:
                 return "Very high complexity - consider monitoring dashboard or tools"
         
-        def _generate_experiment_assessment(self) -> Dict[str, Any]:
-            """Generate overall experiment assessment."""
+        def _generate_experiment_assessment(self, ari_count: int, metrics_count: int) -> Dict[str, Any]:
+            """Generate overall experiment assessment from the ARI and metric counts."""
             complexity_score = 0
             
             # ARI complexity
-            ari_count = len(self._compile_all_aris(
-                self.responses.get("merchant_aris", "")
-            ))
             if ari_count > 10:
                 complexity_score += 2
             elif ari_count > 5:
                 complexity_score += 1
             
             # Metrics complexity  
-            metrics_count = len(self._compile_all_metrics(
-                self.responses.get("metrics_to_monitor", []),
-                self.responses.get("custom_metrics", "")
-            ))
             if metrics_count > 10:
                 complexity_score += 2
             elif metrics_count > 5: